@@ -1,16 +1,281 @@
 import os
 import re
 import json
+import base64
+import hmac
 import time
-import random
+import uuid
+import itertools
 import requests
 import logging
-from datetime import datetime
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from collections import deque
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
+from decimal import Decimal, ROUND_HALF_UP
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib.parse import urlencode
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+# Load environment variables from .env once, when the module is imported
+load_dotenv()
+
+# Library logger; handlers and levels are configured by the application
 logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+# Refresh cached OAuth tokens this many seconds before PayPal expires them
+TOKEN_EXPIRY_MARGIN = 60
+
+# (connect, read) timeout in seconds for PayPal API calls, so a stalled
+# connection cannot hold a request thread indefinitely
+REQUEST_TIMEOUT = (3.05, 15)
+
+# Maximum number of debug log entries the agent keeps between requests
+MAX_DEBUG_LOGS = 200
+
+# Maximum number of characters of debug details written at INFO level
+LOG_CONTENT_LIMIT = 500
+
+# Date formats for the reporting APIs; transaction ranges cover whole UTC days
+DATE_FORMAT = "%Y-%m-%d"
+RANGE_START_FORMAT = "%Y-%m-%dT00:00:00Z"
+RANGE_END_FORMAT = "%Y-%m-%dT23:59:59Z"
+
+# Number of days of transaction history to fetch
+TRANSACTION_HISTORY_DAYS = 30
+
+# Smallest currency unit used when formatting amounts
+CENT = Decimal("0.01")
+
+# Static parts of a Payouts API request; per-call fields are filled in by _send_money
+PAYOUT_BATCH_HEADER_TEMPLATE = {
+    "email_subject": "You received a payment",
+    "email_message": "You received a payment. Thanks for using our service!"
+}
+PAYOUT_ITEM_TEMPLATE = {
+    "recipient_type": "EMAIL",
+    "note": "Thanks for your patronage!"
+}
+
+# Seconds a fetched balance is reused before the reporting API is queried again
+BALANCE_CACHE_TTL = 30
+
+# Seconds a fetched transaction history is reused; new transactions show up
+# in the reporting API with a delay anyway
+TRANSACTIONS_CACHE_TTL = 60
+
+# HTTP status codes the Payouts API returns for an accepted batch
+PAYOUT_OK_STATUSES = frozenset({200, 201, 202})
+
+# Bytes of an error response body included in logs and debug details
+ERROR_BODY_LIMIT = 2048
+
+# Largest JSON document (in characters) dumped to the terminal/debug output
+MAX_DUMP_SIZE = 64 * 1024
+
+# URL-encoded OAuth request body, requesting the scopes the agent needs
+TOKEN_REQUEST_BODY = urlencode({
+    "grant_type": "client_credentials",
+    "scope": "https://uri.paypal.com/services/payments/payment https://uri.paypal.com/services/payments/refund https://uri.paypal.com/services/reporting/search/read https://uri.paypal.com/services/wallet/balance/read"
+})
+
+# Number of distinct normalized messages whose parsed intent is memoized, and
+# the longest message that is cached
+PARSE_CACHE_SIZE = 256
+PARSE_CACHE_MAX_LENGTH = 256
+
+# Intents that only read account data and never move money
+READ_ONLY_INTENTS = frozenset({"check_balance", "transaction_history", "account_overview"})
+
+# Worker threads shared by all agents for concurrent read-only PayPal calls,
+# so an overview request does not start and tear down its own pool
+REPORTING_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="paypal-reporting")
+
+def _dumps_pretty(obj, max_size=MAX_DUMP_SIZE):
+    """Serialize an API payload as indented JSON for terminal/debug output.
+    
+    Oversized or unserializable payloads are replaced by a short summary so
+    that debug output can never blow up a request that is otherwise fine.
+    
+    Args:
+        obj: JSON-compatible object.
+        max_size (int, optional): Largest document to return. Defaults to MAX_DUMP_SIZE.
+        
+    Returns:
+        str: The indented JSON document, or a summary of it.
+    """
+    try:
+        dumped = json.dumps(obj, indent=2, default=str)
+    except (TypeError, ValueError) as e:
+        return json.dumps({"__unserializable__": True, "error": str(e)})
+    
+    if len(dumped) > max_size:
+        return json.dumps({
+            "__truncated__": True,
+            "size": len(dumped),
+            "keys": list(obj)[:20] if isinstance(obj, dict) else None
+        }, default=str)
+    return dumped
+
+def _log_blob(label, blob, limit=LOG_CONTENT_LIMIT):
+    """Log a label followed by a possibly large payload.
+    
+    The payload is only stringified when INFO is enabled. Payloads longer
+    than limit are truncated at INFO and logged in full at DEBUG, so at
+    most two records are emitted.
+    
+    Args:
+        label (str): Text identifying the payload.
+        blob: Payload to log; converted with str().
+        limit (int, optional): Characters logged at INFO. Defaults to LOG_CONTENT_LIMIT.
+    """
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    
+    text = str(blob)
+    if len(text) <= limit:
+        logger.info("%s - %s", label, text)
+        return
+    
+    logger.info("%s - %s... (truncated)", label, text[:limit])
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("%s - Full details: %s", label, text)
+
+def _response_preview(response, limit=ERROR_BODY_LIMIT):
+    """Decode at most limit bytes of a response body for error messages.
+    
+    Avoids decoding a whole (possibly huge) error page via response.text.
+    
+    Args:
+        response (requests.Response): The API response.
+        limit (int, optional): Maximum number of bytes to decode. Defaults to ERROR_BODY_LIMIT.
+        
+    Returns:
+        str: The start of the response body.
+    """
+    return response.content[:limit].decode("utf-8", errors="replace")
+
+@lru_cache(maxsize=1)
+def _transaction_window(day_ordinal):
+    """Return the formatted date range for the transaction history ending on a given day.
+    
+    The range only depends on the (UTC) day, so it is computed once per day.
+    
+    Args:
+        day_ordinal (int): Proleptic Gregorian ordinal of the last day in the range.
+        
+    Returns:
+        tuple: (start_date, end_date) strings for the reporting API.
+    """
+    end_date = date.fromordinal(day_ordinal)
+    start_date = end_date - timedelta(days=TRANSACTION_HISTORY_DAYS)
+    return start_date.strftime(RANGE_START_FORMAT), end_date.strftime(RANGE_END_FORMAT)
+
+class _LazyJSON:
+    """Wrap a payload so it is only serialized when a log record is formatted."""
+    
+    __slots__ = ("obj",)
+    
+    def __init__(self, obj):
+        self.obj = obj
+    
+    def __str__(self):
+        return _dumps_pretty(self.obj)
+
+def _format_amount(value):
+    """Format a PayPal decimal amount string with thousands separators.
+    
+    Uses Decimal rather than float so currency values are never rounded
+    through binary floating point.
+    
+    Args:
+        value (str): Amount as returned by PayPal, e.g. "1234.5".
+        
+    Returns:
+        str: The amount with two decimal places, e.g. "1,234.50".
+    """
+    return f"{Decimal(value).quantize(CENT, rounding=ROUND_HALF_UP):,}"
+
+def _loads_json(body):
+    """Decode a raw JSON body that has already been read from a response.
+    
+    Args:
+        body (bytes): The response body.
+        
+    Returns:
+        The decoded JSON document, or an empty dict if the body is empty or not valid JSON.
+    """
+    if not body:
+        return {}
+    try:
+        return json.loads(body)
+    except ValueError:
+        return {}
+
+# Intent patterns, compiled once at import.
+
+# "send $X to NAME", "pay NAME $X", "transfer $X to NAME", "send NAME $X", "give NAME $X";
+# named groups tell the amount and recipient apart whichever word order was used.
+# The patterns are tried in this order (not merged into one alternation), so a
+# message with several send commands always pays the same one
+_SEND_MONEY_PATTERNS = (
+    re.compile(r"send\s+\$?(?P<amount>[\d.]+)\s+to\s+(?P<recipient>[a-zA-Z\s]+)"),
+    re.compile(r"pay\s+(?P<recipient>[a-zA-Z\s]+)\s+\$?(?P<amount>[\d.]+)"),
+    re.compile(r"transfer\s+\$?(?P<amount>[\d.]+)\s+to\s+(?P<recipient>[a-zA-Z\s]+)"),
+    re.compile(r"send\s+(?P<recipient>[a-zA-Z\s]+)\s+\$?(?P<amount>[\d.]+)"),
+    re.compile(r"give\s+(?P<recipient>[a-zA-Z\s]+)\s+\$?(?P<amount>[\d.]+)"),
+)
+
+# Read-only intents in one pattern: each group is named after its intent and
+# looks ahead from the start of the message, so a single search returns the
+# highest-priority intent found anywhere (overview, then balance, then
+# history) and match.lastgroup names it
+_READ_INTENT_RE = re.compile(
+    # "overview"/"dashboard"/"summary" or balance and transactions asked together
+    r"^(?:(?P<account_overview>(?=.*?(?:"
+    r"\b(?:overview|dashboard|summary)\b"
+    r"|balance\s+and\s+(?:my\s+)?(?:recent\s+)?(?:transactions|payments|history)"
+    r")))"
+    r"|(?P<check_balance>(?=.*?(?:"
+    r"(?:check|show|what(?:'s| is))\s+my\s+balance"
+    r"|how\s+much\s+(?:money|cash|funds)\s+(?:do\s+i\s+have|is\s+in\s+my\s+account)"
+    r")))"
+    r"|(?P<transaction_history>(?=.*?(?:"
+    r"(?:show|get|list)\s+(?:my\s+)?(?:recent\s+)?(?:transactions|payments|history)"
+    r"|what\s+(?:are\s+my|have\s+been\s+my)\s+(?:recent\s+)?(?:transactions|payments)"
+    r"))))",
+    re.DOTALL
+)
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _match_intent(message):
+    """Match a normalized message against the intent patterns.
+    
+    Results are memoized, so repeated messages skip the regex work.
+    
+    Args:
+        message (str): The stripped, lowercased message.
+        
+    Returns:
+        tuple: (intent, entities) where entities is a tuple of (name, value) pairs.
+    """
+    # Check for send money intent
+    for pattern in _SEND_MONEY_PATTERNS:
+        match = pattern.search(message)
+        if match:
+            recipient = match.group("recipient").strip()
+            return "send_money", (("recipient", recipient), ("amount", match.group("amount")))
+    
+    # Check for the read-only intents (overview, balance, history) in one search
+    match = _READ_INTENT_RE.match(message)
+    if match:
+        return match.lastgroup, ()
+    
+    # If no intent is matched, return None
+    return None, ()
 
 class PayPalAgent:
     """
@@ -18,21 +283,21 @@ class PayPalAgent:
     and executing PayPal API calls.
     """
     
-    def __init__(self):
-        """Initialize the PayPal Agent."""
-        # Load environment variables if not already loaded
-        load_dotenv()
+    def __init__(self, debug_callback=None):
+        """
+        Initialize the PayPal Agent.
         
-        # Use environment variables if available
+        Args:
+            debug_callback (callable, optional): Called as debug_callback(type, message, details)
+                for each debug log instead of storing it on the agent. Defaults to None.
+        """
+        # Use environment variables if available (.env is loaded once at import)
         self.client_id = os.getenv("PAYPAL_CLIENT_ID")
         self.client_secret = os.getenv("PAYPAL_CLIENT_SECRET")
         self.mode = os.getenv("PAYPAL_MODE", "sandbox")
         
         # Set base URLs based on mode
-        if self.mode == "sandbox":
-            self.base_url = "https://api-m.sandbox.paypal.com"
-        else:
-            self.base_url = "https://api-m.paypal.com"
+        self._configure_endpoints()
         
         # Check if credentials are available
         if self.client_id and self.client_secret:
@@ -41,8 +306,92 @@ class PayPalAgent:
             self.is_configured = False
             logger.warning("PayPal credentials not found. Please set credentials using set_credentials().")
         
-        # For storing debug logs that will be displayed in the UI
-        self.debug_logs = []  
+        # Precompute the OAuth request headers for the current credentials
+        self._prepare_token_headers()
+        
+        # Reuse keep-alive connections to the PayPal API across calls
+        self.session = self._create_session()
+        
+        # Cached OAuth access token and the monotonic time at which it expires, kept
+        # as one tuple so lock-free readers always see a matching pair.
+        # The lock makes concurrent callers wait for a single token refresh; it is
+        # reentrant because credential switches hold it while clearing the token.
+        self._token = (None, 0.0)
+        self._token_lock = threading.RLock()
+        
+        # Held while credentials are replaced so concurrent switches do not interleave
+        self._credentials_lock = threading.Lock()
+        
+        # (token, headers) pair built for the cached token, rebuilt only when the token changes
+        self._api_headers = (None, None)
+        
+        # Payout batch IDs are a per-agent random prefix plus a counter, which keeps
+        # them unique across processes without a clock read or RNG call per payout
+        self._batch_prefix = f"BATCH-{int(time.time())}-{uuid.uuid4().hex[:8]}"
+        self._batch_sequence = itertools.count(1)
+        
+        # Last successful balance result and the monotonic time it was fetched
+        self._balance_cache = (None, 0.0)
+        
+        # Last successful transaction history result and when it was fetched
+        self._transactions_cache = (None, 0.0)
+        
+        # Bumped whenever the cached reads go stale (payout, credential change); a
+        # read only stores its result if the generation is unchanged since it began
+        self._cache_generation = 0
+        self._cache_lock = threading.Lock()
+        
+        # Reporting results with their ETag/Last-Modified validators, keyed by URL:
+        # url -> (params, etag, last_modified, result)
+        self._validated_results = {}
+        
+        # For storing debug logs that will be displayed in the UI; bounded so
+        # a long-running agent that is never drained cannot grow without limit
+        self.debug_logs = deque(maxlen=MAX_DEBUG_LOGS)
+        self.debug_callback = debug_callback
+        
+    def _configure_endpoints(self):
+        """Set the base URL and the PayPal API endpoint URLs for the current mode."""
+        if self.mode == "sandbox":
+            self.base_url = "https://api-m.sandbox.paypal.com"
+        else:
+            self.base_url = "https://api-m.paypal.com"
+        
+        self._token_url = f"{self.base_url}/v1/oauth2/token"
+        self._payouts_url = f"{self.base_url}/v1/payments/payouts"
+        self._balances_url = f"{self.base_url}/v1/reporting/balances"
+        self._transactions_url = f"{self.base_url}/v1/reporting/transactions"
+    
+    def _prepare_token_headers(self):
+        """Build the OAuth token request headers, including Basic auth, once per credential change."""
+        self._token_headers = {
+            "Accept-Language": "en_US",
+            "Content-Type": "application/x-www-form-urlencoded"
+        }
+        if self.client_id and self.client_secret:
+            basic_auth = base64.b64encode(f"{self.client_id}:{self.client_secret}".encode()).decode()
+            self._token_headers["Authorization"] = f"Basic {basic_auth}"
+    
+    def _create_session(self):
+        """Create an HTTP session with a small connection pool for the PayPal API.
+        
+        Returns:
+            requests.Session: Session whose connections are kept alive between calls.
+        """
+        session = requests.Session()
+        # Every PayPal endpoint returns JSON, so set Accept once for all requests
+        session.headers.update({"Accept": "application/json"})
+        
+        # Retry transient failures; urllib3 never retries non-idempotent POSTs (payouts)
+        retries = Retry(
+            total=2,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retries)
+        session.mount("https://", adapter)
+        return session
         
     def debug_log(self, log_type, message, details=None):
         """Add a debug log that will be displayed in the UI.
@@ -53,51 +402,363 @@ class PayPalAgent:
             message (str): Log message
             details (dict, optional): Additional details
         """
-        # Log to standard logger as well
-        logger.info(f"{log_type}: {message} - {details}")
+        # Log to standard logger as well; skip building the label when INFO is off
+        if logger.isEnabledFor(logging.INFO):
+            _log_blob(f"{log_type}: {message}", details)
+
+        # Hand the log straight to the app when it registered a callback
+        if self.debug_callback is not None:
+            self.debug_callback(log_type, message, details)
+            return
         
-        # Store log for later retrieval by the app
+        # Store log for later retrieval by the app, which timestamps the
+        # entries itself when it adds them to its log
         log_entry = {
-            "timestamp": time.time(),
             "type": log_type,
             "message": message,
             "details": details
         }
         self.debug_logs.append(log_entry)
+    def _cache_access_token(self, token_data):
+        """Store an OAuth token response so later calls can reuse it.
+        
+        Args:
+            token_data (dict): JSON body returned by the /v1/oauth2/token endpoint.
+            
+        Returns:
+            str: The access token.
+        """
+        access_token = token_data["access_token"]
+        self._token = (access_token, time.monotonic() + token_data.get("expires_in", 0))
+        return access_token
+    
+    def _clear_access_token(self, stale_token=None):
+        """Drop the cached OAuth token, e.g. after the credentials change.
+        
+        Args:
+            stale_token (str, optional): Only drop the cache if it still holds this token,
+                so a token refreshed by another caller is kept. Defaults to None (always drop).
+        """
+        with self._token_lock:
+            if stale_token is None or self._token[0] == stale_token:
+                self._token = (None, 0.0)
+    
+    def _cached_token(self):
+        """Return the cached access token if it is usable for at least another minute, else None."""
+        # Read the (token, expiry) pair once; a concurrent clear swaps the whole tuple
+        access_token, expiry = self._token
+        if access_token and time.monotonic() < expiry - TOKEN_EXPIRY_MARGIN:
+            return access_token
+        return None
+    
     def _get_access_token(self):
         """Get an OAuth access token from PayPal.
         
+        The token is cached until shortly before it expires, so repeated
+        actions do not each pay for an OAuth round-trip.
+        
+        Returns:
+            str: The access token if successful, None otherwise.
+        """
+        # Reuse the cached token while it is valid for at least another minute
+        access_token = self._cached_token()
+        if access_token:
+            return access_token
+        
+        with self._token_lock:
+            # Another caller may have refreshed the token while we waited for the lock
+            return self._cached_token() or self._request_access_token()
+    
+    def _post_token_request(self):
+        """POST to the OAuth token endpoint.
+        
+        Returns:
+            requests.Response: The token endpoint response.
+        """
+        # Headers (with Basic auth) and body are precomputed when credentials change
+        return self.session.post(
+            self._token_url,
+            headers=self._token_headers,
+            data=TOKEN_REQUEST_BODY,
+            timeout=REQUEST_TIMEOUT
+        )
+    
+    def _request_access_token(self):
+        """Request a new OAuth access token from PayPal and cache it.
+        
         Returns:
             str: The access token if successful, None otherwise.
         """
         try:
-            auth_url = f"{self.base_url}/v1/oauth2/token"
-            headers = {
-                "Accept": "application/json",
-                "Accept-Language": "en_US"
-            }
-            # Add specific scopes to request proper permissions
-            data = {
-                "grant_type": "client_credentials",
-                "scope": "https://uri.paypal.com/services/payments/payment https://uri.paypal.com/services/payments/refund https://uri.paypal.com/services/reporting/search/read https://uri.paypal.com/services/wallet/balance/read"
-            }
-            
-            response = requests.post(
-                auth_url,
-                auth=(self.client_id, self.client_secret),
-                headers=headers,
-                data=data
-            )
+            response = self._post_token_request()
             
             if response.status_code == 200:
-                return response.json()["access_token"]
+                return self._cache_access_token(response.json())
             else:
-                logger.error(f"Failed to get access token: {response.text}")
+                logger.error("Failed to get access token: %s", _response_preview(response))
                 return None
         except Exception as e:
-            logger.error(f"Error getting access token: {str(e)}")
+            logger.error("Error getting access token: %s", e)
             return None            
     
+    def _get_api_headers(self, access_token):
+        """Return the REST API request headers for an access token.
+        
+        The headers dict is built once per token and shared between calls,
+        so callers must copy it before adding request-specific headers.
+        
+        Args:
+            access_token (str): OAuth access token.
+            
+        Returns:
+            dict: Authorization and content type headers.
+        """
+        headers_token, headers = self._api_headers
+        if headers_token != access_token:
+            headers = {
+                "Authorization": f"Bearer {access_token}",
+                "Content-Type": "application/json"
+            }
+            self._api_headers = (access_token, headers)
+        return headers
+    
+    def _api_request(self, method, url, access_token, extra_headers=None, **kwargs):
+        """
+        Make an authenticated PayPal REST API call.
+        
+        If PayPal rejects the token with a 401 (e.g. it was revoked before its
+        expiry), the cached token is dropped and the call is retried once with
+        a fresh one.
+        
+        Args:
+            method (str): HTTP method.
+            url (str): Endpoint URL.
+            access_token (str): OAuth access token to use.
+            extra_headers (dict, optional): Request-specific headers. Defaults to None.
+            **kwargs: Extra arguments passed to requests (params, data, ...).
+            
+        Returns:
+            requests.Response: The API response.
+        """
+        def headers_for(token):
+            headers = self._get_api_headers(token)
+            if extra_headers:
+                # The shared headers dict must not be modified
+                headers = dict(headers, **extra_headers)
+            return headers
+        
+        kwargs.setdefault("timeout", REQUEST_TIMEOUT)
+        response = self.session.request(method, url, headers=headers_for(access_token), **kwargs)
+        if response.status_code == 401:
+            logger.info("PayPal rejected the cached access token, refreshing it")
+            self._clear_access_token(access_token)
+            fresh_token = self._get_access_token()
+            if fresh_token:
+                response = self.session.request(method, url, headers=headers_for(fresh_token), **kwargs)
+        return response
+    
+    def _conditional_get(self, url, access_token, params):
+        """
+        GET a reporting endpoint, revalidating the result stored for it if any.
+        
+        When a result was stored for the same URL and parameters, its ETag and
+        Last-Modified validators are sent so PayPal can answer 304 Not Modified
+        without a body.
+        
+        Args:
+            url (str): Endpoint URL.
+            access_token (str): OAuth access token to use.
+            params (dict): Query parameters.
+            
+        Returns:
+            tuple: (response, cached_result) where cached_result is the stored result
+                if PayPal answered 304, None otherwise.
+        """
+        entry = self._validated_results.get(url)
+        if entry and entry[0] != params:
+            entry = None
+        
+        extra_headers = None
+        if entry:
+            _, etag, last_modified, _ = entry
+            extra_headers = {}
+            if etag:
+                extra_headers["If-None-Match"] = etag
+            if last_modified:
+                extra_headers["If-Modified-Since"] = last_modified
+        
+        response = self._api_request("GET", url, access_token, extra_headers=extra_headers, params=params)
+        if response.status_code == 304 and entry:
+            return response, entry[3]
+        return response, None
+    
+    def _store_validated_result(self, url, params, response, result, generation):
+        """
+        Remember a result together with the validators PayPal sent for it.
+        
+        Args:
+            url (str): Endpoint URL.
+            params (dict): Query parameters of the request.
+            response (requests.Response): The 200 response the result was built from.
+            result (dict): The agent response built from it.
+            generation (int): Value of _cache_generation when the read began.
+        """
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if etag or last_modified:
+            with self._cache_lock:
+                # A read that began under other credentials must not leave its
+                # validators behind, or the new account could get its 304 result
+                if generation == self._cache_generation:
+                    self._validated_results[url] = (params, etag, last_modified, result)
+    
+    def _invalidate_cached_results(self, clear_validated=False):
+        """
+        Drop the cached balance and transaction history and start a new cache generation.
+        
+        Args:
+            clear_validated (bool, optional): Also drop the results kept for ETag/Last-Modified
+                revalidation, e.g. when the credentials change. Defaults to False.
+        """
+        with self._cache_lock:
+            self._cache_generation += 1
+            self._balance_cache = (None, 0.0)
+            self._transactions_cache = (None, 0.0)
+            if clear_validated:
+                self._validated_results = {}
+    
+    def _store_cached_result(self, cache_name, generation, result):
+        """
+        Store a read result in a TTL cache unless the cache went stale while it was fetched.
+        
+        Args:
+            cache_name (str): Attribute holding the cache, e.g. "_balance_cache".
+            generation (int): Value of _cache_generation when the read began.
+            result (dict): The result to cache.
+        """
+        with self._cache_lock:
+            # A payout or credential change since the read began makes the result stale
+            if generation == self._cache_generation:
+                setattr(self, cache_name, (result, time.monotonic()))
+    
+    def _set_credentials_core(self, client_id, client_secret, mode, record=None):
+        """
+        Store PayPal API credentials and verify them by requesting an access token.
+        
+        Args:
+            client_id (str): PayPal client ID.
+            client_secret (str): PayPal client secret.
+            mode (str): PayPal mode ('sandbox' or 'live').
+            record (callable, optional): Called as record(type, message, details) for each
+                debug step. Defaults to None, in which case no debug steps are built.
+            
+        Returns:
+            bool: True if the credentials were verified, False otherwise.
+        """
+        if not client_id or not client_secret:
+            if record:
+                record("error", "Missing credentials", {
+                    "client_id_provided": bool(client_id),
+                    "client_secret_provided": bool(client_secret)
+                })
+            return False
+        
+        # Serialize credential switches; concurrent calls would otherwise
+        # interleave session, endpoint and token resets
+        with self._credentials_lock:
+            # Re-submitting the active credentials keeps the verified token and caches
+            if self.is_configured and self._cached_token() and self._credentials_match(client_id, client_secret, mode):
+                if record:
+                    record("info", "Credentials unchanged, reusing cached access token", {"mode": mode})
+                return True
+            
+            # Hold the token lock for the whole switch, so a concurrent refresh cannot
+            # post the old account's credentials and cache its token over the new one
+            with self._token_lock:
+                try:
+                    # Store credentials
+                    if record:
+                        record("action", "Storing credentials", {"mode": mode})
+                    
+                    self.client_id = client_id
+                    self.client_secret = client_secret
+                    self.mode = mode
+                    self._clear_access_token()
+                    self._prepare_token_headers()
+                    
+                    # Start from a fresh connection pool for the new credentials
+                    self.session.close()
+                    self.session = self._create_session()
+                    
+                    # Cached results belong to the previous account
+                    self._invalidate_cached_results(clear_validated=True)
+                    
+                    # Set base URL based on mode
+                    self._configure_endpoints()
+                    
+                    if record:
+                        record("api", "Testing PayPal API connection", {"base_url": self.base_url})
+                        record("api", "Requesting OAuth token", {"url": self._token_url})
+                    
+                    # Test credentials by getting an access token
+                    try:
+                        response = self._post_token_request()
+                    except Exception as e:
+                        logger.error("Error getting access token: %s", e)
+                        self.is_configured = False
+                        if record:
+                            record("error", "Error connecting to PayPal API", {"error": str(e)})
+                        return False
+                    
+                    if response.status_code != 200:
+                        logger.error("Failed to get access token: %s", _response_preview(response))
+                        self.is_configured = False
+                        if record:
+                            record("error", "Failed to authenticate with PayPal API", {
+                                "status_code": response.status_code,
+                                "response": _response_preview(response)
+                            })
+                        return False
+                    
+                    token_data = response.json()
+                    self._cache_access_token(token_data)
+                    self.is_configured = True
+                    
+                    if record:
+                        record("info", "PayPal API connection successful", {
+                            "token_type": token_data.get("token_type"),
+                            "expires_in": token_data.get("expires_in"),
+                            "app_id": token_data.get("app_id")
+                        })
+                    return True
+                except Exception as e:
+                    logger.error("Failed to set PayPal credentials: %s", e)
+                    self.is_configured = False
+                    if record:
+                        record("error", "Error configuring PayPal SDK", {"error": str(e)})
+                    return False
+    
+    def _credentials_match(self, client_id, client_secret, mode):
+        """
+        Check whether the given credentials are the ones currently in use.
+        
+        The ID and secret are compared with hmac.compare_digest, and both are
+        always compared, so the timing does not reveal how much of either matched.
+        
+        Args:
+            client_id (str): PayPal client ID.
+            client_secret (str): PayPal client secret.
+            mode (str): PayPal mode ('sandbox' or 'live').
+            
+        Returns:
+            bool: True if the credentials and mode are unchanged.
+        """
+        if not self.client_id or not self.client_secret:
+            return False
+        id_match = hmac.compare_digest(client_id.encode(), self.client_id.encode())
+        secret_match = hmac.compare_digest(client_secret.encode(), self.client_secret.encode())
+        return id_match & secret_match and mode == self.mode
+    
     def set_credentials(self, client_id, client_secret, mode="sandbox"):
         """
         Set PayPal API credentials.
@@ -110,29 +771,7 @@ class PayPalAgent:
         Returns:
             bool: True if credentials were set successfully, False otherwise.
         """
-        try:
-            self.client_id = client_id
-            self.client_secret = client_secret
-            self.mode = mode
-            
-            # Update base URL based on mode
-            if self.mode == "sandbox":
-                self.base_url = "https://api-m.sandbox.paypal.com"
-            else:
-                self.base_url = "https://api-m.paypal.com"
-            
-            # Test the credentials by getting an access token
-            access_token = self._get_access_token()
-            if access_token:
-                self.is_configured = True
-                return True
-            else:
-                self.is_configured = False
-                return False
-        except Exception as e:
-            logger.error(f"Failed to set PayPal credentials: {str(e)}")
-            self.is_configured = False
-            return False
+        return self._set_credentials_core(client_id, client_secret, mode)
             
     def set_credentials_with_debug(self, client_id, client_secret, mode="sandbox"):
         """
@@ -148,116 +787,37 @@ class PayPalAgent:
         """
         debug_info = []
         
+        def record(log_type, message, details):
+            debug_info.append({"type": log_type, "message": message, "details": details})
+        
         # Validate credentials
-        debug_info.append({
-            "type": "reasoning",
-            "message": "Validating credentials",
-            "details": {
-                "client_id_length": len(client_id) if client_id else 0,
-                "client_secret_length": len(client_secret) if client_secret else 0,
-                "mode": mode
-            }
+        record("reasoning", "Validating credentials", {
+            "client_id_length": len(client_id) if client_id else 0,
+            "client_secret_length": len(client_secret) if client_secret else 0,
+            "mode": mode
         })
         
-        if not client_id or not client_secret:
-            debug_info.append({
-                "type": "error",
-                "message": "Missing credentials",
-                "details": {
-                    "client_id_provided": bool(client_id),
-                    "client_secret_provided": bool(client_secret)
-                }
-            })
-            return False, debug_info
+        success = self._set_credentials_core(client_id, client_secret, mode, record)
+        return success, debug_info
+    
+    def warm_up(self):
+        """
+        Fetch and cache an access token ahead of the first user request.
         
-        try:
-            # Store credentials
-            debug_info.append({
-                "type": "action",
-                "message": "Storing credentials",
-                "details": {"mode": mode}
-            })
-            
-            self.client_id = client_id
-            self.client_secret = client_secret
-            self.mode = mode
-            
-            # Set base URL based on mode
-            if self.mode == "sandbox":
-                self.base_url = "https://api-m.sandbox.paypal.com"
-            else:
-                self.base_url = "https://api-m.paypal.com"
-                
-            debug_info.append({
-                "type": "api",
-                "message": "Testing PayPal API connection",
-                "details": {"base_url": self.base_url}
-            })
-            
-            # Test credentials by getting an access token
-            try:
-                auth_url = f"{self.base_url}/v1/oauth2/token"
-                headers = {
-                    "Accept": "application/json",
-                    "Accept-Language": "en_US"
-                }
-                data = {"grant_type": "client_credentials"}
-                
-                debug_info.append({
-                    "type": "api",
-                    "message": "Requesting OAuth token",
-                    "details": {"url": auth_url}
-                })
-                
-                response = requests.post(
-                    auth_url,
-                    auth=(self.client_id, self.client_secret),
-                    headers=headers,
-                    data=data
-                )
-                
-                if response.status_code == 200:
-                    token_data = response.json()
-                    self.is_configured = True
-                    
-                    debug_info.append({
-                        "type": "info",
-                        "message": "PayPal API connection successful",
-                        "details": {
-                            "token_type": token_data.get("token_type"),
-                            "expires_in": token_data.get("expires_in"),
-                            "app_id": token_data.get("app_id")
-                        }
-                    })
-                else:
-                    self.is_configured = False
-                    debug_info.append({
-                        "type": "error",
-                        "message": "Failed to authenticate with PayPal API",
-                        "details": {
-                            "status_code": response.status_code,
-                            "response": response.text
-                        }
-                    })
-                    return False, debug_info
-            except Exception as e:
-                self.is_configured = False
-                debug_info.append({
-                    "type": "error",
-                    "message": "Error connecting to PayPal API",
-                    "details": {"error": str(e)}
-                })
-                return False, debug_info
-            
-            return True, debug_info
-        except Exception as e:
-            debug_info.append({
-                "type": "error",
-                "message": "Error configuring PayPal SDK",
-                "details": {"error": str(e)}
-            })
-            logger.error(f"Failed to set PayPal credentials: {str(e)}")
-            return False, debug_info
+        The token request also opens a keep-alive connection to the PayPal API
+        host, so the first chat message skips both the TLS handshake and the
+        OAuth round-trip.
+        
+        Returns:
+            bool: True if an access token was obtained, False otherwise.
+        """
+        if not self.is_configured:
+            return False
+        
+        access_token = self._get_access_token()
+        if access_token:
+            logger.info("PayPal connection warmed up (%s mode)", self.mode)
+        return access_token is not None
     
     def process_message(self, message):
         """
@@ -299,7 +859,7 @@ class PayPalAgent:
             tuple: (response, debug_info) where response is a dict and debug_info is a list of debug steps.
         """
         # Clear previous debug logs
-        self.debug_logs = []
+        self.debug_logs.clear()
         debug_info = []
         
         # Start timing
@@ -399,6 +959,19 @@ class PayPalAgent:
                 "message": f"An error occurred while executing {intent}: {str(e)}"
             }, debug_info
     
+    def is_read_only(self, message):
+        """
+        Check whether processing a message can never move money.
+        
+        Args:
+            message (str): The user's natural language message.
+            
+        Returns:
+            bool: True if the message maps to a read-only intent or to no intent at all.
+        """
+        intent, _ = self._parse_message(message)
+        return intent is None or intent in READ_ONLY_INTENTS
+    
     def _parse_message(self, message):
         """
         Parse the user's message to determine intent and extract entities.
@@ -410,55 +983,17 @@ class PayPalAgent:
             tuple: (intent, entities) where intent is a string and entities is a dictionary.
         """
         # Convert message to lowercase for easier processing
-        message = message.lower()
-        
-        # Define patterns for different intents
-        send_money_patterns = [
-            r"send\s+(\$?[\d.]+)\s+to\s+([a-zA-Z\s]+)",
-            r"pay\s+([a-zA-Z\s]+)\s+(\$?[\d.]+)",
-            r"transfer\s+(\$?[\d.]+)\s+to\s+([a-zA-Z\s]+)",
-            r"send\s+([a-zA-Z\s]+)\s+(\$?[\d.]+)",
-            r"give\s+([a-zA-Z\s]+)\s+(\$?[\d.]+)"
-        ]
-        
-        check_balance_patterns = [
-            r"(check|show|what('s| is))\s+my\s+balance",
-            r"how\s+much\s+(money|cash|funds)\s+(do\s+i\s+have|is\s+in\s+my\s+account)"
-        ]
-        
-        transaction_history_patterns = [
-            r"(show|get|list)\s+(my\s+)?(recent\s+)?(transactions|payments|history)",
-            r"what\s+(are\s+my|have\s+been\s+my)\s+(recent\s+)?(transactions|payments)"
-        ]
-        
-        # Check for send money intent
-        for pattern in send_money_patterns:
-            match = re.search(pattern, message)
-            if match:
-                groups = match.groups()
-                
-                # Determine which group is the amount and which is the recipient
-                if groups[0].replace('$', '').replace('.', '').isdigit():
-                    amount = groups[0].replace('$', '')
-                    recipient = groups[1].strip()
-                else:
-                    amount = groups[1].replace('$', '')
-                    recipient = groups[0].strip()
-                
-                return "send_money", {"recipient": recipient, "amount": amount}
-        
-        # Check for check balance intent
-        for pattern in check_balance_patterns:
-            if re.search(pattern, message):
-                return "check_balance", {}
+        message = message.strip().lower()
         
-        # Check for transaction history intent
-        for pattern in transaction_history_patterns:
-            if re.search(pattern, message):
-                return "transaction_history", {}
+        # Repeated short messages are served from the parse cache; long ones are
+        # parsed directly so they cannot fill the cache with large keys
+        if len(message) <= PARSE_CACHE_MAX_LENGTH:
+            intent, entities = _match_intent(message)
+        else:
+            intent, entities = _match_intent.__wrapped__(message)
         
-        # If no intent is matched, return None
-        return None, {}
+        # Callers get their own entities dict, never the cached tuple
+        return intent, dict(entities)
     
     def _execute_action(self, intent, entities):
         """
@@ -478,13 +1013,15 @@ class PayPalAgent:
                 return self._check_balance()
             elif intent == "transaction_history":
                 return self._get_transaction_history()
+            elif intent == "account_overview":
+                return self._get_account_overview()
             else:
                 return {
                     "type": "error",
                     "message": f"I don't know how to {intent} yet."
                 }
         except Exception as e:
-            logger.error(f"Error executing action {intent}: {str(e)}")
+            logger.error("Error executing action %s: %s", intent, e)
             return {
                 "type": "error",
                 "message": f"An error occurred while executing {intent}: {str(e)}"
@@ -513,45 +1050,34 @@ class PayPalAgent:
                     "message": "Failed to authenticate with PayPal API"
                 }
             
-            # Create a payout using the Payouts API
-            logger.info(f"Sending ${amount_float} to {recipient} using PayPal API")
-            
             # Set up API request
-            payouts_url = f"{self.base_url}/v1/payments/payouts"
-            headers = {
-                "Authorization": f"Bearer {access_token}",
-                "Content-Type": "application/json"
-            }
+            payouts_url = self._payouts_url
             
-            # Create a unique batch ID
-            batch_id = f"BATCH-{int(time.time())}-{random.randint(1000, 9999)}"
-            
-            # Prepare the payout data
-            payload = {
-                "sender_batch_header": {
-                    "sender_batch_id": batch_id,
-                    "email_subject": "You received a payment",
-                    "email_message": "You received a payment. Thanks for using our service!"
-                },
-                "items": [
-                    {
-                        "recipient_type": "EMAIL",
-                        "amount": {
-                            "value": str(amount_float),
-                            "currency": "USD"
-                        },
-                        "note": "Thanks for your patronage!",
-                        "receiver": recipient,
-                        "sender_item_id": f"ITEM-{int(time.time())}"
-                    }
-                ]
-            }
+            # Create a unique batch ID from the per-agent prefix and a sequence number
+            batch_number = next(self._batch_sequence)
+            batch_id = f"{self._batch_prefix}-{batch_number}"
+            
+            # Prepare the payout data from the static templates, filling in the per-call fields
+            logger.info("Sending $%s to %s using PayPal API", amount_float, recipient)
+            
+            item = dict(PAYOUT_ITEM_TEMPLATE)
+            item["amount"] = {"value": str(amount_float), "currency": "USD"}
+            item["receiver"] = recipient
+            item["sender_item_id"] = f"ITEM-{batch_number}"
+            
+            batch_header = dict(PAYOUT_BATCH_HEADER_TEMPLATE)
+            batch_header["sender_batch_id"] = batch_id
+            
+            payload = {"sender_batch_header": batch_header, "items": [item]}
             
             # Make the API request
-            payout_response = requests.post(payouts_url, headers=headers, json=payload)
-            logger.info(f"Payout API status code: {payout_response.status_code}")
+            payout_response = self._api_request("POST", payouts_url, access_token, json=payload)
+            logger.info("Payout API status code: %s", payout_response.status_code)
             
-            if payout_response.status_code in [200, 201, 202]:
+            if payout_response.status_code in PAYOUT_OK_STATUSES:
+                # The balance and history have changed, so drop the cached reads
+                self._invalidate_cached_results()
+                
                 payout_data = payout_response.json()
                 batch_id = payout_data.get("batch_header", {}).get("payout_batch_id", "")
                 batch_status = payout_data.get("batch_header", {}).get("batch_status", "")
@@ -565,29 +1091,51 @@ class PayPalAgent:
                     }
                 }
             else:
-                error_message = payout_response.json().get("message", "Unknown error")
-                logger.error(f"Failed to send money: {payout_response.text}")
+                # Read the body once and reuse it for both the message and the log preview
+                body = payout_response.content
+                body_preview = body[:ERROR_BODY_LIMIT].decode("utf-8", errors="replace")
+                error_data = _loads_json(body)
+                error_message = error_data.get("message", "Unknown error") if isinstance(error_data, dict) else "Unknown error"
+                logger.error("Failed to send money: %s", body_preview)
                 return {
                     "type": "error",
                     "message": f"Failed to send money: {error_message}"
                 }
         except Exception as e:
-            logger.error(f"Error sending money: {str(e)}")
+            logger.error("Error sending money: %s", e)
             return {
                 "type": "error",
                 "message": f"An error occurred while sending money: {str(e)}"
             }
     
-    def _check_balance(self):
+    def _check_balance(self, access_token=None):
         """
         Check the user's PayPal balance using the PayPal REST API.
         
+        Successful results are cached for BALANCE_CACHE_TTL seconds, so repeated
+        balance questions in a chat do not each hit the reporting API.
+        
+        Args:
+            access_token (str, optional): Token already fetched by the caller.
+                If not provided, one is obtained from the token cache.
+        
         Returns:
             dict: Response containing the user's balance or an error message.
         """
         try:
+            # Serve a recent balance from the cache
+            cached_result, cached_at = self._balance_cache
+            if cached_result and time.monotonic() - cached_at < BALANCE_CACHE_TTL:
+                self.debug_log("info", "Returning cached balance", {
+                    "age_seconds": round(time.monotonic() - cached_at, 1)
+                })
+                return cached_result
+            
+            # Note the cache generation before fetching, so a stale result is not cached
+            generation = self._cache_generation
+            
             # Get access token
-            access_token = self._get_access_token()
+            access_token = access_token or self._get_access_token()
             if not access_token:
                 return {
                     "type": "error",
@@ -596,19 +1144,14 @@ class PayPalAgent:
             
             # Use the v1 reporting endpoint
             logger.info("Fetching balance using PayPal v1 Reporting API")
-            today = datetime.now().strftime("%Y-%m-%d")
+            today = datetime.now(timezone.utc).strftime(DATE_FORMAT)
             
-            reporting_url = f"{self.base_url}/v1/reporting/balances"
+            reporting_url = self._balances_url
             params = {
                 "currency_code": "USD",
                 "as_of_date": today
             }
             
-            headers = {
-                "Authorization": f"Bearer {access_token}",
-                "Content-Type": "application/json"
-            }
-            
             # Log the API request details
             self.debug_log("info", "Making PayPal API request", {
                 "url": reporting_url,
@@ -616,30 +1159,29 @@ class PayPalAgent:
                 "api_version": "v1 Reporting"
             })
             
-            # Print API request details to terminal
-            print("\n===== PAYPAL API REQUEST =====")
-            print(f"URL: {reporting_url}")
-            print(f"Parameters: {params}")
-            print(f"Headers: {headers}")
-            print("==============================\n")
+            logger.debug("PayPal API request: GET %s params=%s", reporting_url, params)
             
             # Make the API request
-            reporting_response = requests.get(reporting_url, headers=headers, params=params)
+            reporting_response, cached_result = self._conditional_get(reporting_url, access_token, params)
             self.debug_log("info", "PayPal API response received", {
                 "status_code": reporting_response.status_code,
                 "api_version": "v1 Reporting"
             })
             
-            # Print API response details to terminal
-            print("\n===== PAYPAL API RESPONSE =====")
-            print(f"Status Code: {reporting_response.status_code}")
-            print(f"Response Headers: {dict(reporting_response.headers)}")
-            print("Response Body:")
+            if cached_result:
+                # 304 Not Modified: the balance we returned last time is still current
+                self._store_cached_result("_balance_cache", generation, cached_result)
+                return cached_result
             
             if reporting_response.status_code == 200:
                 reporting_data = reporting_response.json()
-                print(json.dumps(reporting_data, indent=2))
-                print("==============================\n")
+                # The body is only serialized if a DEBUG record is actually emitted
+                logger.debug(
+                    "PayPal API response: status=%s headers=%s body=\n%s",
+                    reporting_response.status_code,
+                    reporting_response.headers,
+                    _LazyJSON(reporting_data)
+                )
                 
                 # Log the full API response
                 self.debug_log("info", "PayPal balance data retrieved", {
@@ -664,9 +1206,9 @@ class PayPalAgent:
                     "balance_path": "balances[0].available_balance.value"
                 })
                 
-                formatted_amount = "{:,.2f}".format(float(available_balance))
+                formatted_amount = _format_amount(available_balance)
                 
-                return {
+                result = {
                     "type": "success",
                     "message": f"Your current balance is ${formatted_amount}",
                     "details": {
@@ -675,29 +1217,50 @@ class PayPalAgent:
                         "source": "PayPal REST API v1 Reporting"
                     }
                 }
+                self._store_cached_result("_balance_cache", generation, result)
+                self._store_validated_result(reporting_url, params, reporting_response, result, generation)
+                return result
             else:
-                logger.error(f"V1 API failed: {reporting_response.text}")
+                logger.error("V1 API failed: %s", _response_preview(reporting_response))
                 return {
                     "type": "error",
                     "message": "Unable to retrieve your PayPal balance. This may be due to API permission restrictions."
                 }
         except Exception as e:
-            logger.error(f"Error checking balance: {str(e)}")
+            logger.error("Error checking balance: %s", e)
             return {
                 "type": "error",
                 "message": f"An error occurred while checking your balance: {str(e)}"
             }
     
-    def _get_transaction_history(self):
+    def _get_transaction_history(self, access_token=None):
         """
         Get the user's transaction history using the PayPal REST API.
         
+        Successful results are cached for TRANSACTIONS_CACHE_TTL seconds and
+        dropped as soon as a payout is sent.
+        
+        Args:
+            access_token (str, optional): Token already fetched by the caller.
+                If not provided, one is obtained from the token cache.
+        
         Returns:
             dict: Response containing the user's transaction history.
         """
         try:
+            # Serve a recent transaction history from the cache
+            cached_result, cached_at = self._transactions_cache
+            if cached_result and time.monotonic() - cached_at < TRANSACTIONS_CACHE_TTL:
+                self.debug_log("info", "Returning cached transaction history", {
+                    "age_seconds": round(time.monotonic() - cached_at, 1)
+                })
+                return cached_result
+            
+            # Note the cache generation before fetching, so a stale result is not cached
+            generation = self._cache_generation
+            
             # Get access token
-            access_token = self._get_access_token()
+            access_token = access_token or self._get_access_token()
             if not access_token:
                 return {
                     "type": "error",
@@ -707,35 +1270,31 @@ class PayPalAgent:
             # Use the transactions search endpoint
             logger.info("Fetching transaction history using PayPal API")
             
-            # Set up date range (last 30 days)
-            from datetime import timedelta
-            end_date = datetime.now()
-            start_date = end_date - timedelta(days=30)
-            
-            # Format dates for API
-            start_date_str = start_date.strftime("%Y-%m-%dT00:00:00Z")
-            end_date_str = end_date.strftime("%Y-%m-%dT23:59:59Z")
+            # Set up date range (last 30 days), formatted once per UTC day
+            start_date_str, end_date_str = _transaction_window(datetime.now(timezone.utc).toordinal())
             
             # Set up API request
-            transactions_url = f"{self.base_url}/v1/reporting/transactions"
-            headers = {
-                "Authorization": f"Bearer {access_token}",
-                "Content-Type": "application/json"
-            }
+            transactions_url = self._transactions_url
             
             params = {
                 "start_date": start_date_str,
                 "end_date": end_date_str,
-                "fields": "transaction_info,payer_info,shipping_info,auction_info,cart_info,incentive_info,store_info"
+                # Only transaction_info is read below; the other field groups just add payload
+                "fields": "transaction_info"
             }
             
             # Make the API request
-            transactions_response = requests.get(transactions_url, headers=headers, params=params)
-            logger.info(f"Transactions API status code: {transactions_response.status_code}")
+            transactions_response, cached_result = self._conditional_get(transactions_url, access_token, params)
+            logger.info("Transactions API status code: %s", transactions_response.status_code)
+            
+            if cached_result:
+                # 304 Not Modified: reuse the transactions parsed last time
+                self._store_cached_result("_transactions_cache", generation, cached_result)
+                return cached_result
             
             if transactions_response.status_code == 200:
                 transactions_data = transactions_response.json()
-                logger.info(f"Found {len(transactions_data.get('transaction_details', []))} transactions")
+                logger.info("Found %s transactions", len(transactions_data.get('transaction_details', [])))
                 
                 # Process and format the transactions
                 transactions = []
@@ -751,22 +1310,60 @@ class PayPalAgent:
                         "status": transaction_info.get("transaction_status", "")
                     })
                 
-                return {
+                result = {
                     "type": "success",
                     "message": "Here are your recent transactions:",
                     "details": {
                         "transactions": transactions
                     }
                 }
+                self._store_cached_result("_transactions_cache", generation, result)
+                self._store_validated_result(transactions_url, params, transactions_response, result, generation)
+                return result
             else:
-                logger.error(f"Failed to get transactions: {transactions_response.text}")
+                logger.error("Failed to get transactions: %s", _response_preview(transactions_response))
                 return {
                     "type": "error",
                     "message": "Unable to retrieve your transaction history. This may be due to API permission restrictions."
                 }
         except Exception as e:
-            logger.error(f"Error getting transaction history: {str(e)}")
+            logger.error("Error getting transaction history: %s", e)
             return {
                 "type": "error",
                 "message": f"An error occurred while getting your transaction history: {str(e)}"
             }
+    
+    def _get_account_overview(self):
+        """
+        Get the user's balance and recent transactions together.
+        
+        Both reporting requests are issued concurrently, so the overview takes
+        about as long as the slower of the two calls rather than their sum.
+        Each half checks its own cache before fetching an access token, so a
+        fully cached overview makes no PayPal calls at all.
+        
+        Returns:
+            dict: Response containing the balance and transactions, or an error message.
+        """
+        balance_future = REPORTING_EXECUTOR.submit(self._check_balance)
+        transactions_future = REPORTING_EXECUTOR.submit(self._get_transaction_history)
+        balance_result = balance_future.result()
+        transactions_result = transactions_future.result()
+        
+        # Report whichever half succeeded; only fail if both did
+        details = {}
+        if balance_result["type"] == "success":
+            details.update(balance_result["details"])
+        if transactions_result["type"] == "success":
+            details["transactions"] = transactions_result["details"]["transactions"]
+        
+        # Both halves fail the same way when authentication fails; say it once
+        messages = [balance_result["message"]]
+        if transactions_result["message"] != balance_result["message"]:
+            messages.append(transactions_result["message"])
+        
+        return {
+            "type": "success" if details else "error",
+            "message": " ".join(messages),
+            "details": details
+        }
@@ -1,27 +1,40 @@
 import os
 import json
 import time
-from flask import Flask, request, jsonify, render_template
+import logging
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from flask import Flask, g, request, jsonify, render_template
 from dotenv import load_dotenv
 from agent import PayPalAgent
 
 # Load environment variables
 load_dotenv()
 
+# Configure logging for the application and the agent
+logging.basicConfig(level=logging.INFO)
+
 app = Flask(__name__)
 
-# Initialize PayPal Agent
-paypal_agent = PayPalAgent()
+# API responses are read by the UI, not by people: skip key sorting and indentation
+app.config['JSON_SORT_KEYS'] = False
+app.config['JSONIFY_PRETTYPRINT_REGULAR'] = False
 
-# Connect the agent's debug_log method to our add_debug_log function
-def agent_debug_log_handler(log_type, message, details=None):
-    add_debug_log(log_type, message, details)
-    
-# Override the agent's debug_log method
-paypal_agent.debug_log = agent_debug_log_handler
+# Chat and credential payloads are tiny; refuse anything larger before it is buffered
+app.config['MAX_CONTENT_LENGTH'] = 64 * 1024
+
+# Maximum number of debug logs kept in memory
+MAX_DEBUG_LOGS = 100
 
-# Store debug logs in memory
-debug_logs = []
+# Maximum number of messages accepted by a single /api/chat/batch request
+MAX_CHAT_BATCH = 20
+
+# Worker threads that process the messages of a read-only batch request concurrently
+chat_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="chat-batch")
+
+# Store debug logs in memory; the deque drops the oldest entry once full
+debug_logs = deque(maxlen=MAX_DEBUG_LOGS)
 
 def add_debug_log(log_type, message, details=None):
     """Add a debug log entry."""
@@ -32,24 +45,85 @@ def add_debug_log(log_type, message, details=None):
         "details": details
     }
     debug_logs.append(log_entry)
-    # Keep only the last 100 logs to avoid memory bloat
-    if len(debug_logs) > 100:
-        debug_logs.pop(0)
     return log_entry
 
+def add_debug_steps(steps):
+    """Add the debug steps returned by the agent in one pass with a shared timestamp."""
+    now = time.time()
+    debug_logs.extend({
+        "timestamp": now,
+        "type": step.get("type", "info"),
+        "message": step.get("message", ""),
+        "details": step.get("details", None)
+    } for step in steps)
+
+def recent_debug_logs(count=10):
+    """Return the most recent debug logs, oldest first."""
+    return list(islice(debug_logs, max(0, len(debug_logs) - count), None))
+
+def read_json_body():
+    """Parse the request body read by read_limited_body as JSON.
+    
+    Returns:
+        dict: The decoded JSON object, or an empty dict if the body is empty,
+            malformed or not a JSON object, so handlers answer with a 400.
+    """
+    body = g.get("request_body", b"")
+    if not body:
+        return {}
+    try:
+        data = json.loads(body)
+    except ValueError:
+        return {}
+    return data if isinstance(data, dict) else {}
+
+# Initialize PayPal Agent, sending its debug logs straight to add_debug_log
+paypal_agent = PayPalAgent(debug_callback=add_debug_log)
+
+# Optionally connect to PayPal at startup so the first request is not slowed down
+if os.getenv("PAYPAL_WARMUP") == "1":
+    paypal_agent.warm_up()
+
+@app.before_request
+def read_limited_body():
+    """Read at most MAX_CONTENT_LENGTH bytes of the request body, answering 413 for more.
+    
+    Werkzeug 2.0 only enforces MAX_CONTENT_LENGTH when parsing forms, so raw
+    JSON bodies are capped here. Reading one byte past the limit also catches
+    chunked bodies that carry no Content-Length.
+    """
+    limit = app.config['MAX_CONTENT_LENGTH']
+    if request.content_length is None or request.content_length <= limit:
+        g.request_body = request.stream.read(limit + 1)
+        if len(g.request_body) <= limit:
+            return None
+    
+    add_debug_log("error", "Request body too large", {"content_length": request.content_length})
+    return jsonify({
+        "status": "error",
+        "error": "Request body too large"
+    }), 413
+
+# The chat page takes no template context, so it is rendered once and reused
+index_html = None
+
 @app.route('/')
 def index():
     """Render the chat interface."""
+    global index_html
     # Log page load
     add_debug_log("info", "Main page loaded", {"user_agent": request.headers.get('User-Agent')})
-    return render_template('index.html')
+    # Re-render on every hit in debug mode so template edits show up
+    if index_html is None or app.debug:
+        index_html = render_template('index.html')
+    return index_html
 
 @app.route('/api/chat', methods=['POST'])
 def chat():
     """Process user message and return agent response."""
     try:
         start_time = time.time()
-        data = request.json
+        data = read_json_body()
         user_message = data.get('message', '')
         
         add_debug_log("info", "Chat request received", {"message": user_message})
@@ -68,12 +142,7 @@ def chat():
         response, debug_info = paypal_agent.process_message_with_debug(user_message)
         
         # Log each step of the debug info
-        for debug_step in debug_info:
-            add_debug_log(
-                debug_step.get("type", "info"),
-                debug_step.get("message", ""),
-                debug_step.get("details", None)
-            )
+        add_debug_steps(debug_info)
         
         # Calculate response time
         processing_time = time.time() - start_time
@@ -83,14 +152,68 @@ def chat():
         return jsonify({
             "status": "success",
             "response": response,
-            "debug_logs": debug_logs[-10:]  # Send the 10 most recent logs
+            "debug_logs": recent_debug_logs()  # Send the 10 most recent logs
         })
     except Exception as e:
         add_debug_log("error", "Error processing chat request", {"error": str(e)})
         return jsonify({
             "status": "error",
             "error": str(e),
-            "debug_logs": debug_logs[-10:]
+            "debug_logs": recent_debug_logs()
+        }), 500
+
+@app.route('/api/chat/batch', methods=['POST'])
+def chat_batch():
+    """Process several user messages in one request and return the responses in order."""
+    try:
+        start_time = time.time()
+        data = read_json_body()
+        messages = data.get('messages')
+        
+        if not isinstance(messages, list) or not messages:
+            add_debug_log("error", "No messages provided in batch request")
+            return jsonify({
+                "status": "error",
+                "error": "No messages provided"
+            }), 400
+        
+        if len(messages) > MAX_CHAT_BATCH:
+            add_debug_log("error", "Batch request too large", {"count": len(messages)})
+            return jsonify({
+                "status": "error",
+                "error": f"At most {MAX_CHAT_BATCH} messages can be sent in one batch"
+            }), 400
+        
+        if not all(isinstance(message, str) and message for message in messages):
+            add_debug_log("error", "Invalid messages in batch request")
+            return jsonify({
+                "status": "error",
+                "error": "Every message must be a non-empty string"
+            }), 400
+        
+        add_debug_log("info", "Chat batch request received", {"count": len(messages)})
+        
+        if all(paypal_agent.is_read_only(message) for message in messages):
+            # Reads are independent, so overlap their PayPal calls; map keeps the order
+            responses = list(chat_executor.map(paypal_agent.process_message, messages))
+        else:
+            # Payouts must apply in the order given, and reads after them must see them
+            responses = [paypal_agent.process_message(message) for message in messages]
+        
+        processing_time = time.time() - start_time
+        add_debug_log("info", "Batch request processed", {"processing_time_ms": round(processing_time * 1000)})
+        
+        return jsonify({
+            "status": "success",
+            "responses": responses,
+            "debug_logs": recent_debug_logs()
+        })
+    except Exception as e:
+        add_debug_log("error", "Error processing chat batch request", {"error": str(e)})
+        return jsonify({
+            "status": "error",
+            "error": str(e),
+            "debug_logs": recent_debug_logs()
         }), 500
 
 @app.route('/api/debug/logs', methods=['GET'])
@@ -99,7 +222,7 @@ def get_debug_logs():
     count = request.args.get('count', 10, type=int)
     return jsonify({
         "status": "success",
-        "logs": debug_logs[-count:]
+        "logs": recent_debug_logs(count)
     })
 
 @app.route('/api/authenticate', methods=['POST'])
@@ -107,7 +230,7 @@ def authenticate():
     """Authenticate with PayPal."""
     try:
         start_time = time.time()
-        data = request.json
+        data = read_json_body()
         client_id = data.get('client_id')
         client_secret = data.get('client_secret')
         
@@ -127,12 +250,7 @@ def authenticate():
         success, auth_debug_info = paypal_agent.set_credentials_with_debug(client_id, client_secret)
         
         # Log each step of the debug info
-        for debug_step in auth_debug_info:
-            add_debug_log(
-                debug_step.get("type", "info"),
-                debug_step.get("message", ""),
-                debug_step.get("details", None)
-            )
+        add_debug_steps(auth_debug_info)
         
         # Calculate response time
         processing_time = time.time() - start_time
@@ -142,23 +260,24 @@ def authenticate():
             return jsonify({
                 "status": "success",
                 "message": "Authentication successful",
-                "debug_logs": debug_logs[-10:]
+                "debug_logs": recent_debug_logs()
             })
         else:
             add_debug_log("error", "Authentication failed", {"processing_time_ms": round(processing_time * 1000)})
             return jsonify({
                 "status": "error",
                 "error": "Failed to authenticate with PayPal",
-                "debug_logs": debug_logs[-10:]
+                "debug_logs": recent_debug_logs()
             }), 401
     except Exception as e:
         add_debug_log("error", "Error during authentication", {"error": str(e)})
         return jsonify({
             "status": "error",
             "error": str(e),
-            "debug_logs": debug_logs[-10:]
+            "debug_logs": recent_debug_logs()
         }), 500
 
 if __name__ == '__main__':
     add_debug_log("info", "Application started", {"mode": os.getenv("PAYPAL_MODE", "sandbox")})
-    app.run(debug=True, port=5001)
+    # The debugger and reloader are opt-in; set FLASK_DEBUG=1 for local development
+    app.run(debug=os.getenv("FLASK_DEBUG") == "1", port=5001)
@@ -0,0 +1,46 @@
+"""
+Gunicorn configuration for serving the PayPal Merchant Assistant.
+
+Run with:
+    gunicorn -c gunicorn_conf.py app:app
+
+Requests spend nearly all their time waiting on the PayPal API, so gevent
+workers are used: gunicorn monkey-patches the standard library before the
+app is imported, and each worker overlaps many outbound HTTPS waits on
+cooperative greenlets. Keep the Flask views synchronous; do not combine
+gevent with async views.
+
+Set WORKER_CLASS=gthread to use plain threaded workers instead (for example
+where gevent is not available); each worker then runs GUNICORN_THREADS
+request threads.
+"""
+import os
+
+bind = os.getenv("BIND", "127.0.0.1:5001")
+
+# One process by default: credentials set through /api/authenticate and the
+# debug log buffer live in the worker's agent, so with several workers other
+# workers would stay unconfigured. gevent/threads provide the concurrency.
+# Only raise this when credentials come from .env (see README).
+workers = int(os.getenv("WEB_CONCURRENCY", 1))
+worker_class = os.getenv("WORKER_CLASS", "gevent")
+
+# Concurrent requests per gevent worker
+worker_connections = 1000
+
+# Request threads per gthread worker; each can block on PayPal independently.
+# Only set for gthread: gunicorn silently switches sync workers to gthread
+# whenever threads > 1, and gevent workers ignore it.
+if worker_class == "gthread":
+    threads = int(os.getenv("GUNICORN_THREADS", 16))
+
+# Seconds to hold idle client keep-alive connections open
+keepalive = 5
+
+# Worker heartbeat timeout. For gevent and gthread workers this is not a
+# per-request limit, so slow PayPal calls are not cut off: a single call can
+# take about 54s (3 attempts x (3.05s connect + 15s read)), twice that when a
+# 401 triggers a token refresh and retry, and overview/batch requests chain
+# several calls. Sync workers would be killed mid-request (even mid-payout)
+# after this many seconds, so do not use them with this value.
+timeout = 60